@@ -1,4 +1,6 @@
-from typing import List, Dict
+import hashlib
+from functools import lru_cache
+from typing import List, Dict, Iterator
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config import Config
 
@@ -8,6 +10,22 @@ Use the given context to answer questions accurately. Cite your sources clearly.
 If unsure, say so politely. Be concise and factual.
 """
 
+def _dedupe_by_content(items: List[Dict]) -> List[Dict]:
+    seen = set()
+    unique = []
+    for it in items:
+        norm = " ".join((it.get("content") or "").lower().split())
+        if not norm:
+            # Nothing to compare; distinct snippet-less results must keep their sources.
+            unique.append(it)
+            continue
+        key = hashlib.blake2b(norm.encode("utf-8"), digest_size=16).digest()
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(it)
+    return unique
+
 def _mk_context_block(items: List[Dict]) -> str:
     if not items:
         return "No context."
@@ -25,19 +43,21 @@ def _mk_citations(items: List[Dict]) -> str:
             cites.append(f"- {it['source']}")
     return "\n".join(cites)
 
-def synthesize_answer(query: str, model_name: str, local_ctx: List[Dict], web_ctx: List[Dict]) -> str:
-    llm = ChatGoogleGenerativeAI(
+@lru_cache(maxsize=4)
+def _get_llm(model_name: str) -> ChatGoogleGenerativeAI:
+    return ChatGoogleGenerativeAI(
         model=model_name,
         google_api_key=Config.GEMINI_API_KEY,
         temperature=0.3,
         max_output_tokens=1024
     )
 
-    merged = (local_ctx or []) + (web_ctx or [])
+def _mk_prompt(query: str, local_ctx: List[Dict], web_ctx: List[Dict]) -> str:
+    merged = _dedupe_by_content((local_ctx or []) + (web_ctx or []))
     context_block = _mk_context_block(merged)
     citations = _mk_citations(merged)
 
-    prompt = f"""{SYSTEM_PROMPT}
+    return f"""{SYSTEM_PROMPT}
 
 User Question:
 {query}
@@ -48,5 +68,14 @@ Context:
 Sources:
 {citations if citations else "- None"}
 """
-    resp = llm.invoke(prompt)
+
+def synthesize_answer(query: str, model_name: str, local_ctx: List[Dict], web_ctx: List[Dict]) -> str:
+    resp = _get_llm(model_name).invoke(_mk_prompt(query, local_ctx, web_ctx))
     return resp.content if hasattr(resp, "content") else str(resp)
+
+def synthesize_answer_stream(query: str, model_name: str, local_ctx: List[Dict], web_ctx: List[Dict]) -> Iterator[str]:
+    """Yield the answer as it is generated, so the UI can render the first tokens immediately."""
+    for chunk in _get_llm(model_name).stream(_mk_prompt(query, local_ctx, web_ctx)):
+        text = chunk.content if hasattr(chunk, "content") else str(chunk)
+        if text:
+            yield text
@@ -1,15 +1,17 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True)
 class Plan:
     route: str
     reason: str
 
+# (use_local, use_web) -> Plan; built once and shared across turns.
+_PLANS = {
+    (True, True): Plan(route="hybrid", reason="Use local + web for full coverage."),
+    (True, False): Plan(route="local", reason="Use local SCET docs."),
+    (False, True): Plan(route="web", reason="Use live web info."),
+    (False, False): Plan(route="llm", reason="Use LLM directly."),
+}
+
 def make_plan(query: str, has_local: bool, use_web: bool, use_local: bool) -> Plan:
-    if use_local and use_web:
-        return Plan(route="hybrid", reason="Use local + web for full coverage.")
-    if use_local:
-        return Plan(route="local", reason="Use local SCET docs.")
-    if use_web:
-        return Plan(route="web", reason="Use live web info.")
-    return Plan(route="llm", reason="Use LLM directly.")
+    return _PLANS[(bool(use_local), bool(use_web))]
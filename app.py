@@ -1,10 +1,12 @@
+import asyncio
+import threading
 import streamlit as st
 from config import Config
-from tools.web_search import web_search
-from retriever.local_index import build_or_load_local_retriever, retrieve_local
+from tools.web_search import web_search_async
+from retriever.local_index import build_or_load_local_retriever, retrieve_local_async
 from retriever.router import pick_route
 from agents.controller import make_plan
-from agents.answer_synthesizer import synthesize_answer
+from agents.answer_synthesizer import synthesize_answer_stream
 
 st.set_page_config(page_title="SU_BOT Agentic RAG", page_icon="🤖", layout="wide")
 st.title("🤖 SU_BOT — Agentic RAG (Hybrid: Local + Web)")
@@ -31,6 +33,34 @@ if st.sidebar.button("♻️ Rebuild Local Index"):
     build_or_load_local_retriever("data/scet")
     st.sidebar.success("Local SCET index rebuilt successfully!")
 
+async def _gather_context(q, plan):
+    async def _none():
+        return []
+
+    local_task = retrieve_local_async(q, local_retriever) if plan.route in ("local", "hybrid") and has_local else _none()
+    web_task = web_search_async(q, max_results=web_k) if plan.route in ("web", "hybrid") else _none()
+
+    # Local + web retrieval run concurrently: latency is max(t_local, t_web), not the sum.
+    local_ctx, web_ctx = await asyncio.gather(local_task, web_task, return_exceptions=True)
+    if isinstance(local_ctx, BaseException):
+        print(f"⚠️ Local retrieval failed: {local_ctx}")
+        local_ctx = []
+    if isinstance(web_ctx, BaseException):
+        print(f"⚠️ Web search failed: {web_ctx}")
+        web_ctx = []
+    return local_ctx, web_ctx
+
+# Streamlit starts every script run on a fresh thread, so a per-run loop (and its
+# to_thread executor) would leak each turn. One long-lived loop serves all runs.
+@st.cache_resource(show_spinner=False)
+def _event_loop():
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="su-bot-asyncio", daemon=True).start()
+    return loop
+
+def _run_async(coro):
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
 if "chat" not in st.session_state:
     st.session_state.chat = []
 
@@ -49,14 +79,9 @@ if q:
             route_hint = pick_route(q, has_local=has_local)
             plan = make_plan(q, has_local, route_hint.use_web, route_hint.use_local)
 
-            local_ctx, web_ctx = [], []
-            if plan.route in ("local", "hybrid") and has_local:
-                local_ctx = retrieve_local(q, local_retriever)
-            if plan.route in ("web", "hybrid"):
-                web_ctx = web_search(q, max_results=web_k)
+            local_ctx, web_ctx = _run_async(_gather_context(q, plan))
 
-            ans = synthesize_answer(q, model, local_ctx, web_ctx)
-            st.markdown(ans)
-            st.session_state.chat.append({"role": "assistant", "content": ans})
+        ans = st.write_stream(synthesize_answer_stream(q, model, local_ctx, web_ctx))
+        st.session_state.chat.append({"role": "assistant", "content": ans})
 
 st.markdown("<hr><center>Built by Karan Mehta | Gemini + Tavily + OpenAI Embeddings</center>", unsafe_allow_html=True)
@@ -7,6 +7,8 @@ class Config:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    EMBED_BACKEND = os.getenv("EMBED_BACKEND", "torch").strip().lower()
+    EMBED_BACKENDS = ("torch", "onnx")
 
     @staticmethod
     def validate():
@@ -19,3 +21,7 @@ class Config:
             missing.append("OPENAI_API_KEY")
         if missing:
             raise ValueError(f"❌ Missing keys in .env: {', '.join(missing)}")
+        if Config.EMBED_BACKEND not in Config.EMBED_BACKENDS:
+            raise ValueError(
+                f"❌ Invalid EMBED_BACKEND '{Config.EMBED_BACKEND}' in .env (expected one of: {', '.join(Config.EMBED_BACKENDS)})"
+            )
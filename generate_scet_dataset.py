@@ -1,14 +1,23 @@
 import os
-import time
 import json
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    from selectolax.parser import HTMLParser  # C-backed parser; BeautifulSoup is the fallback
+except ImportError:
+    HTMLParser = None
 
 BASE_URL = "https://scet.ac.in"
 OUTPUT_DIR = "data/scet_selenium"
+PAGE_LOAD_TIMEOUT = 15
+CONTENT_SELECTOR = "h1, h2, h3, p, li"
+CHALLENGE_TITLE = "Just a moment"  # Cloudflare interstitial, which is itself readyState "complete"
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -19,21 +28,40 @@ def setup_driver():
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("window-size=1920x1080")
+    # Only text is extracted, so skip downloading images
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
     return driver
 
-def extract_page(driver, url):
+def _has_content(driver):
+    # PDFs and other downloads never render text blocks; let extract_page reject them right away.
+    if driver.execute_script("return document.contentType") != "text/html":
+        return True
+    if CHALLENGE_TITLE in driver.title:
+        return False
+    return bool(driver.find_elements(By.CSS_SELECTOR, CONTENT_SELECTOR))
+
+def load_page(driver, url):
+    """Navigate to url and wait until real page content (not a challenge page) is rendered."""
     driver.get(url)
-    time.sleep(2)
+    WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(_has_content)
+
+def extract_page(driver, url):
+    load_page(driver, url)
     html = driver.page_source
-    soup = BeautifulSoup(html, "html.parser")
 
-    title = soup.title.text.strip() if soup.title else "Untitled"
-    text_blocks = []
-    for tag in soup.find_all(["h1", "h2", "h3", "p", "li"]):
-        text = tag.get_text(" ", strip=True)
-        if text and len(text) > 30:
-            text_blocks.append(text)
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        title_node = tree.css_first("title")
+        title = title_node.text().strip() if title_node else "Untitled"
+        texts = (node.text(separator=" ", strip=True) for node in tree.css(CONTENT_SELECTOR))
+    else:
+        soup = BeautifulSoup(html, "lxml")
+        title = soup.title.text.strip() if soup.title else "Untitled"
+        texts = (tag.get_text(" ", strip=True) for tag in soup.find_all(["h1", "h2", "h3", "p", "li"]))
+
+    text_blocks = [text for text in texts if text and len(text) > 30]
 
     return {
         "url": url,
@@ -50,33 +78,33 @@ def save_page(data):
 def main():
     print("🚀 Launching Chrome to scrape SCET site...")
     driver = setup_driver()
-    driver.get(BASE_URL)
-    time.sleep(3)
-
-    # Collect all visible links
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.startswith(BASE_URL) or href.startswith("/"):
-            full = href if href.startswith("http") else BASE_URL + href
-            if "mailto" not in full and "javascript" not in full:
-                links.append(full)
-
-    links = sorted(set(links))
-    print(f"🔗 Found {len(links)} links to scrape")
-
     pages = []
-    for link in links[:50]:  # limit to 50 pages
-        try:
-            data = extract_page(driver, link)
-            if len(data["content"]) > 200:
-                save_page(data)
-                pages.append(data)
-        except Exception as e:
-            print(f"⚠️ Error scraping {link}: {e}")
-
-    driver.quit()
+    try:
+        load_page(driver, BASE_URL)
+
+        # Collect all visible links
+        soup = BeautifulSoup(driver.page_source, "lxml")
+        links = []
+        for a in soup.find_all("a", href=True):
+            href = a["href"]
+            if href.startswith(BASE_URL) or href.startswith("/"):
+                full = href if href.startswith("http") else BASE_URL + href
+                if "mailto" not in full and "javascript" not in full:
+                    links.append(full)
+
+        links = sorted(set(links))
+        print(f"🔗 Found {len(links)} links to scrape")
+
+        for link in links[:50]:  # limit to 50 pages
+            try:
+                data = extract_page(driver, link)
+                if len(data["content"]) > 200:
+                    save_page(data)
+                    pages.append(data)
+            except Exception as e:
+                print(f"⚠️ Error scraping {link}: {e}")
+    finally:
+        driver.quit()
 
     with open(os.path.join(OUTPUT_DIR, "_index.json"), "w", encoding="utf-8") as f:
         json.dump(pages, f, indent=2)
@@ -1,13 +1,67 @@
 import os
 import glob
+import uuid
 import asyncio
+from functools import lru_cache
 from typing import List, Dict
+import faiss
+import numpy as np
+import torch
 from langchain.docstore.document import Document
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_core.embeddings import Embeddings
 from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
 from config import Config
 
 INDEX_DIR = ".cache/scet_index"
+# Vectors from different embedding backends are not comparable, so each gets its own index.
+if Config.EMBED_BACKEND != "torch":
+    INDEX_DIR = f"{INDEX_DIR}_{Config.EMBED_BACKEND}"
+QUERY_CACHE_SIZE = 1024
+EMBED_BATCH_SIZE = 256
+
+class _CachedQueryEmbeddings(Embeddings):
+    """Embeddings wrapper that memoizes `embed_query` so Streamlit reruns skip the encoder."""
+
+    def __init__(self, base: Embeddings):
+        self.base = base
+        self._embed_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._embed_query_uncached)
+
+    def _embed_query_uncached(self, text: str) -> tuple:
+        return tuple(self.base.embed_query(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.base.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        # MiniLM's tokenizer is uncased and whitespace-insensitive, so normalizing the key
+        # lets "Who is HOD?" and "who is  hod?" share one cache entry without changing the vector.
+        return list(self._embed_query(" ".join(text.lower().split())))
+
+def _embedding_model_kwargs() -> Dict:
+    if Config.EMBED_BACKEND == "onnx":
+        # int8 (AVX-512 VNNI) ONNX export published in the all-MiniLM-L6-v2 model repo.
+        return {
+            "backend": "onnx",
+            "model_kwargs": {
+                "file_name": "onnx/model_qint8_avx512_vnni.onnx",
+                "provider": "CPUExecutionProvider",
+            },
+        }
+    if torch.cuda.is_available():
+        # MiniLM is accurate in fp16 for cosine/L2 ranking; halves GPU memory traffic.
+        return {"device": "cuda", "model_kwargs": {"torch_dtype": torch.float16}}
+    return {}
+
+@lru_cache(maxsize=1)
+def _get_embeddings() -> _CachedQueryEmbeddings:
+    # ✅ Local HuggingFace embeddings (no API or quota), loaded once per process
+    return _CachedQueryEmbeddings(HuggingFaceEmbeddings(
+        model_name="all-MiniLM-L6-v2",
+        model_kwargs=_embedding_model_kwargs(),
+        encode_kwargs={"batch_size": EMBED_BATCH_SIZE},
+    ))
 
 def _ensure_event_loop():
     try:
@@ -15,9 +69,9 @@ def _ensure_event_loop():
     except RuntimeError:
         asyncio.set_event_loop(asyncio.new_event_loop())
 
-def _collect_docs(data_dir: str) -> List[Document]:
+def _collect_docs(paths: List[str]) -> List[Document]:
     docs = []
-    for path in glob.glob(os.path.join(data_dir, "*.txt")):
+    for path in paths:
         with open(path, "r", encoding="utf-8") as f:
             text = f.read().strip()
             if not text:
@@ -25,6 +79,23 @@ def _collect_docs(data_dir: str) -> List[Document]:
             docs.append(Document(page_content=text, metadata={"source": os.path.basename(path)}))
     return docs
 
+def _build_vectorstore(docs: List[Document], embeddings: Embeddings) -> FAISS:
+    vectors = np.asarray(embeddings.embed_documents([d.page_content for d in docs]), dtype="float32")
+
+    # int8 scalar quantization: 4x smaller than the default IndexFlatL2, with approximate L2 distances.
+    index = faiss.IndexScalarQuantizer(vectors.shape[1], faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+    index.train(vectors)
+    # Add the matrix directly; FAISS.add_embeddings would copy it into a second float32 array.
+    index.add(vectors)
+
+    ids = [str(uuid.uuid4()) for _ in docs]
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(dict(zip(ids, docs))),
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
+
 def build_or_load_local_retriever(data_dir: str = "data/scet"):
     files = glob.glob(os.path.join(data_dir, "*.txt"))
     if not files:
@@ -33,21 +104,22 @@ def build_or_load_local_retriever(data_dir: str = "data/scet"):
 
     _ensure_event_loop()
 
-    # ✅ Local HuggingFace embeddings (no API or quota)
-    embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+    embeddings = _get_embeddings()
 
     if os.path.isdir(INDEX_DIR) and glob.glob(os.path.join(INDEX_DIR, "*")):
         try:
             vs = FAISS.load_local(INDEX_DIR, embeddings, allow_dangerous_deserialization=True)
-            return vs.as_retriever(search_kwargs={"k": 5})
+            # Indexes saved before SQ8 was introduced are flat; fall through and rebuild them.
+            if isinstance(vs.index, faiss.IndexScalarQuantizer):
+                return vs.as_retriever(search_kwargs={"k": 5})
         except Exception:
             pass
 
-    docs = _collect_docs(data_dir)
+    docs = _collect_docs(files)
     if not docs:
         return None
 
-    vs = FAISS.from_documents(docs, embeddings)
+    vs = _build_vectorstore(docs, embeddings)
     os.makedirs(INDEX_DIR, exist_ok=True)
     vs.save_local(INDEX_DIR)
     print(f"✅ Indexed {len(docs)} SCET documents locally.")
@@ -73,3 +145,7 @@ def retrieve_local(query: str, retriever):
             "kind": "local"
         })
     return formatted
+
+async def retrieve_local_async(query: str, retriever):
+    """Run `retrieve_local` off the event loop (FAISS + embedding are sync/CPU-bound)."""
+    return await asyncio.to_thread(retrieve_local, query, retriever)
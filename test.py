@@ -1,7 +1,8 @@
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "https://scet.ac.in"
 DOMAIN = urlparse(BASE_URL).netloc
@@ -9,36 +10,58 @@ DOMAIN = urlparse(BASE_URL).netloc
 # Limit crawling
 MAX_PAGES = 5000
 CRAWL_DEPTH = 3
+MAX_WORKERS = 16
 
 def is_valid_url(url):
     """Check if the link belongs to SCET domain and is valid."""
     return url.startswith(BASE_URL) and not any(x in url for x in ["#", "mailto", "tel", "javascript"])
 
-def crawl_count(base_url=BASE_URL, max_pages=MAX_PAGES, max_depth=CRAWL_DEPTH):
+def fetch_links(session, url):
+    """Fetch a page and return the internal links found on it."""
+    res = session.get(url, timeout=10)
+    if res.status_code != 200:
+        return []
+
+    soup = BeautifulSoup(res.text, "lxml")
+    links = []
+    for a in soup.find_all("a", href=True):
+        link = urljoin(url, a["href"]).split("?")[0]
+        if is_valid_url(link):
+            links.append(link)
+    return links
+
+def crawl_count(base_url=BASE_URL, max_pages=MAX_PAGES, max_depth=CRAWL_DEPTH, max_workers=MAX_WORKERS):
     visited = set()
-    queue = deque([(base_url, 0)])
-
-    while queue and len(visited) < max_pages:
-        url, depth = queue.popleft()
-        if url in visited or depth > max_depth:
-            continue
-        visited.add(url)
-
-        print(f"[{len(visited)}] Crawling: {url}")
-
-        try:
-            res = requests.get(url, timeout=10)
-            if res.status_code != 200:
-                continue
-
-            soup = BeautifulSoup(res.text, "html.parser")
-            for a in soup.find_all("a", href=True):
-                link = urljoin(url, a["href"]).split("?")[0]
-                if is_valid_url(link) and link not in visited:
-                    queue.append((link, depth + 1))
-        except Exception as e:
-            print(f"⚠️ Error fetching {url}: {e}")
-            continue
+    frontier = [base_url]
+    depth = 0
+
+    # One keep-alive session shared by all workers; each BFS level is fetched concurrently.
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        while frontier and depth <= max_depth and len(visited) < max_pages:
+            batch = []
+            for url in frontier:
+                if url in visited or len(visited) >= max_pages:
+                    continue
+                visited.add(url)
+                batch.append(url)
+                print(f"[{len(visited)}] Crawling: {url}")
+
+            futures = {pool.submit(fetch_links, session, url): url for url in batch}
+            # Insertion-ordered set: nav/footer links repeat on every page, queue each once.
+            next_frontier = {}
+            # Collect in submission order so the BFS (and the max_pages cut-off) is deterministic.
+            for fut, url in futures.items():
+                try:
+                    next_frontier.update(dict.fromkeys(link for link in fut.result() if link not in visited))
+                except Exception as e:
+                    print(f"⚠️ Error fetching {url}: {e}")
+
+            frontier = list(next_frontier)
+            depth += 1
 
     return visited
 
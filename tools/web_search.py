@@ -1,9 +1,32 @@
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from tavily import TavilyClient
 from config import Config
 
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 512
+
+# (query, max_results) -> (fetched_at, results), least recently used first.
+_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict]]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()  # web_search runs in worker threads (see web_search_async)
+
+@lru_cache(maxsize=1)
+def _get_client() -> TavilyClient:
+    return TavilyClient(api_key=Config.TAVILY_API_KEY)
+
 def web_search(query: str, max_results: int = 5):
-    client = TavilyClient(api_key=Config.TAVILY_API_KEY)
-    results = client.search(query=query, max_results=max_results, search_depth="advanced")
+    key = (query, max_results)
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < CACHE_TTL_SECONDS:
+            _CACHE.move_to_end(key)
+            return list(hit[1])
+
+    results = _get_client().search(query=query, max_results=max_results, search_depth="advanced")
 
     formatted = []
     for item in results.get("results", []):
@@ -14,4 +37,13 @@ def web_search(query: str, max_results: int = 5):
             "source": item.get("url", ""),
             "kind": "web"
         })
-    return formatted
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic(), formatted)
+        _CACHE.move_to_end(key)
+        if len(_CACHE) > CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return list(formatted)
+
+async def web_search_async(query: str, max_results: int = 5):
+    """Run `web_search` in a worker thread so it can overlap with local retrieval."""
+    return await asyncio.to_thread(web_search, query, max_results)